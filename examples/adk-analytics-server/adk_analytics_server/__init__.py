@@ -2,11 +2,11 @@
 
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 # Load .env from project root (three levels up: package -> example -> examples -> repo root)
 _env_path = Path(__file__).parent.parent.parent.parent / ".env"
 if _env_path.exists():
+    from dotenv import load_dotenv
+
     load_dotenv(_env_path)
 
 __version__ = "1.0.0"
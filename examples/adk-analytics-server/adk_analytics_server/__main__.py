@@ -6,7 +6,6 @@ Commands:
 """
 
 import argparse
-import sys
 
 
 def main() -> None:
@@ -68,6 +67,12 @@ Examples:
         "--log-file",
         help="Write structured JSON logs to file",
     )
+    parser.add_argument(
+        "--log-format",
+        choices=["json", "msgpack"],
+        default="json",
+        help="Log file format (default: json; msgpack needs the msgpack extra)",
+    )
 
     args = parser.parse_args()
 
@@ -82,15 +87,17 @@ def run_mcp_server(args: argparse.Namespace) -> None:
     from pathlib import Path
 
     from .logging import setup_logging
-    from .server import mcp, logger
+    from .server import create_http_app, logger, run_stdio
 
     # Set up logging
     setup_logging(
         verbosity=args.verbose,
         log_file=Path(args.log_file) if args.log_file else None,
+        log_format=args.log_format,
     )
 
     port = args.port or 3003
+    log_level = "debug" if args.verbose else "info"
 
     logger.info("Starting ADK Financial Analytics MCP Server")
     if args.verbose >= 2:
@@ -99,21 +106,26 @@ def run_mcp_server(args: argparse.Namespace) -> None:
         logger.debug("Verbose logging enabled (DEBUG level)")
 
     if args.stdio:
+        import asyncio
+
         logger.info("Running in STDIO mode")
-        mcp.run(transport="stdio")
+        asyncio.run(run_stdio())
     else:
         import uvicorn
-        from starlette.middleware.cors import CORSMiddleware
-
-        app = mcp.streamable_http_app()
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_methods=["*"],
-            allow_headers=["*"],
+
+        from .cors import FastCORS
+        from .uvicorn_options import uvicorn_speedups
+
+        app = FastCORS(create_http_app())
+        logger.info(f"Listening on http://{args.host}:{port}/mcp (SSE at /sse)")
+        uvicorn.run(
+            app,
+            host=args.host,
+            port=port,
+            log_level=log_level,
+            timeout_keep_alive=75,  # Keep idle client connections open between tool calls
+            **uvicorn_speedups(),
         )
-        logger.info(f"Listening on http://{args.host}:{port}/mcp")
-        uvicorn.run(app, host=args.host, port=port)
 
 
 def run_agent_server(args: argparse.Namespace) -> None:
@@ -127,7 +139,9 @@ def run_agent_server(args: argparse.Namespace) -> None:
     log_level = "debug" if args.verbose else "info"
 
     from .agent_server import run_server
-    run_server(host=args.host, port=port, log_level=log_level)
+    from .uvicorn_options import uvicorn_speedups
+
+    run_server(host=args.host, port=port, log_level=log_level, **uvicorn_speedups())
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from typing import Any, AsyncIterator
@@ -59,6 +60,10 @@ class Agent:
     mcp_client: MCPClient
     max_turns: int = 10
     history: list[Message] = field(default_factory=list)
+    stream_batch_ms: float = 10.0  # Coalesce text deltas arriving within this window
+    max_history_messages: int = 40  # History re-sent to the LLM each turn is capped at this
+    max_tool_result_chars: int = 4000  # Older tool results are truncated to this length
+    full_tool_results: int = 5  # Most recent tool results kept untruncated
 
     async def chat(self, user_message: str) -> AsyncIterator[AgentEvent]:
         """Process a user message and yield events.
@@ -76,37 +81,93 @@ class Agent:
         tools = await self.mcp_client.get_tools()
         logger.info(f"Agent has {len(tools)} tools available")
 
+        loop = asyncio.get_running_loop()
+        batch_interval = self.stream_batch_ms / 1000
+
         turns = 0
         while turns < self.max_turns:
             turns += 1
-            logger.debug(f"Agent turn {turns}/{self.max_turns}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Agent turn {turns}/{self.max_turns}")
+
+            # Re-bound history every turn, since tool results accumulate within a chat
+            self._trim_history()
 
             # Collect response from LLM
-            accumulated_text = ""
+            text_parts: list[str] = []
             tool_calls: list[ToolCall] = []
 
-            async for event in self.llm.chat(
+            # Text deltas waiting to be sent; the first delta always goes out immediately
+            pending_text: list[str] = []
+            last_flush = float("-inf")
+
+            stream = self.llm.chat(
                 messages=self.history,
                 tools=tools,
                 system=SYSTEM_PROMPT,
-            ):
-                if event.type == "text_delta" and event.text:
-                    accumulated_text += event.text
-                    yield AgentEvent(type="text", text=event.text)
+            )
+            # Next event, fetched as a task while text is pending so a flush
+            # deadline can pass without cancelling the LLM stream
+            next_event: asyncio.Future[LLMEvent] | None = None
+            try:
+                while True:
+                    try:
+                        if next_event is None and not pending_text:
+                            event = await anext(stream)
+                        else:
+                            if next_event is None:
+                                next_event = asyncio.ensure_future(anext(stream))
+                            if pending_text:
+                                # Flush once the batch window closes, even if the LLM pauses
+                                timeout = max(last_flush + batch_interval - loop.time(), 0)
+                                done, _ = await asyncio.wait((next_event,), timeout=timeout)
+                                if not done:
+                                    yield AgentEvent(type="text", text="".join(pending_text))
+                                    pending_text.clear()
+                                    last_flush = loop.time()
+                                    continue
+                            fetched, next_event = next_event, None
+                            event = await fetched
+                    except StopAsyncIteration:
+                        break
+
+                    if event.type == "text_delta" and event.text:
+                        text_parts.append(event.text)
+                        pending_text.append(event.text)
+                        now = loop.time()
+                        if now - last_flush >= batch_interval:
+                            yield AgentEvent(type="text", text="".join(pending_text))
+                            pending_text.clear()
+                            last_flush = now
+                            # Let other coroutines run between fast bursts of deltas
+                            await asyncio.sleep(0)
+                        continue
+
+                    if pending_text:
+                        yield AgentEvent(type="text", text="".join(pending_text))
+                        pending_text.clear()
+
+                    if event.type == "tool_call" and event.tool_call:
+                        tool_calls.append(event.tool_call)
+                        yield AgentEvent(
+                            type="tool_call",
+                            tool_name=event.tool_call.name,
+                            tool_args=event.tool_call.arguments,
+                        )
 
-                elif event.type == "tool_call" and event.tool_call:
-                    tool_calls.append(event.tool_call)
-                    yield AgentEvent(
-                        type="tool_call",
-                        tool_name=event.tool_call.name,
-                        tool_args=event.tool_call.arguments,
-                    )
+                    elif event.type == "error":
+                        yield AgentEvent(type="error", error=event.error)
+                        return
+            finally:
+                if next_event is not None:
+                    next_event.cancel()
+                    await asyncio.gather(next_event, return_exceptions=True)
 
-                elif event.type == "error":
-                    yield AgentEvent(type="error", error=event.error)
-                    return
+            if pending_text:
+                yield AgentEvent(type="text", text="".join(pending_text))
 
             # Add assistant message to history
+            accumulated_text = "".join(text_parts)
             if accumulated_text or tool_calls:
                 self.history.append(
                     Message(
@@ -122,37 +183,17 @@ class Agent:
                 yield AgentEvent(type="done")
                 return
 
-            # Execute tool calls
+            # Execute tool calls concurrently; results are reported in call order
             for tc in tool_calls:
                 logger.info(f"Executing tool: {tc.name}")
-                try:
-                    result = await self.mcp_client.call_tool(tc.name, tc.arguments)
-
-                    # Yield tool result event
-                    yield AgentEvent(
-                        type="tool_result",
-                        tool_name=tc.name,
-                        tool_result=result.content,
-                    )
-
-                    # If there's structured content, yield it separately for the UI
-                    if result.structured_content:
-                        yield AgentEvent(
-                            type="structured_content",
-                            structured_content=result.structured_content,
-                        )
-
-                    # Add tool result to history
-                    self.history.append(
-                        Message(
-                            role="tool",
-                            content=result.content,
-                            tool_call_id=tc.id,
-                        )
-                    )
-
-                except Exception as e:
-                    error_msg = f"Tool error: {e}"
+            results = await asyncio.gather(
+                *(self.mcp_client.call_tool(tc.name, tc.arguments) for tc in tool_calls),
+                return_exceptions=True,
+            )
+
+            for tc, result in zip(tool_calls, results):
+                if isinstance(result, Exception):
+                    error_msg = f"Tool error: {result}"
                     logger.error(error_msg)
                     yield AgentEvent(type="error", error=error_msg)
 
@@ -160,10 +201,37 @@ class Agent:
                     self.history.append(
                         Message(
                             role="tool",
-                            content=f"Error: {e}",
+                            content=f"Error: {result}",
                             tool_call_id=tc.id,
                         )
                     )
+                    continue
+                if isinstance(result, BaseException):
+                    raise result  # Cancellation and the like
+
+                # Yield tool result event
+                yield AgentEvent(
+                    type="tool_result",
+                    tool_name=tc.name,
+                    tool_result=result.content,
+                )
+                await asyncio.sleep(0)
+
+                # If there's structured content, yield it separately for the UI
+                if result.structured_content:
+                    yield AgentEvent(
+                        type="structured_content",
+                        structured_content=result.structured_content,
+                    )
+
+                # Add tool result to history
+                self.history.append(
+                    Message(
+                        role="tool",
+                        content=result.content,
+                        tool_call_id=tc.id,
+                    )
+                )
 
         # Hit max turns
         logger.warning(f"Agent hit max turns ({self.max_turns})")
@@ -172,6 +240,28 @@ class Agent:
             error=f"Reached maximum number of turns ({self.max_turns})",
         )
 
+    def _trim_history(self) -> None:
+        """Bound the conversation history that is re-sent to the LLM every turn.
+
+        Keeps the first user message plus the most recent messages, and truncates
+        all but the latest few tool results (which can be large JSON payloads).
+        """
+        history = self.history
+        if len(history) > self.max_history_messages:
+            start = len(history) - (self.max_history_messages - 1)
+            # Never start on a tool result whose tool call was dropped
+            while start < len(history) - 1 and history[start].role == "tool":
+                start += 1
+            self.history = [history[0], *history[start:]]
+            logger.debug(f"Trimmed {start - 1} messages from agent history")
+
+        suffix = "...[truncated]"
+        limit = self.max_tool_result_chars
+        tool_messages = [msg for msg in self.history if msg.role == "tool"]
+        for msg in tool_messages[: max(0, len(tool_messages) - self.full_tool_results)]:
+            if len(msg.content) > limit:
+                msg.content = msg.content[: max(0, limit - len(suffix))] + suffix
+
     def clear_history(self) -> None:
         """Clear conversation history."""
         self.history.clear()
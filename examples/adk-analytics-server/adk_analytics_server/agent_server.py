@@ -8,6 +8,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
+import orjson
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import HTMLResponse, JSONResponse, StreamingResponse
@@ -17,6 +18,7 @@ from starlette.staticfiles import StaticFiles
 from .agent import Agent, AgentEvent
 from .llm import create_provider, ConfigError
 from .mcp_client import MCPClient
+from .server import view_http
 
 logger = logging.getLogger(__name__)
 
@@ -117,7 +119,7 @@ async def chat(request: Request) -> StreamingResponse:
     )
 
 
-def format_sse_event(event: AgentEvent) -> str:
+def format_sse_event(event: AgentEvent) -> bytes:
     """Format an AgentEvent as an SSE message."""
     data = {"type": event.type}
 
@@ -134,7 +136,7 @@ def format_sse_event(event: AgentEvent) -> str:
     if event.error is not None:
         data["error"] = event.error
 
-    return f"data: {json.dumps(data)}\n\n"
+    return b"data: " + orjson.dumps(data) + b"\n\n"
 
 
 async def clear_history(request: Request) -> JSONResponse:
@@ -162,6 +164,7 @@ def create_app() -> Starlette:
         Route("/chat", chat, methods=["POST"]),
         Route("/clear", clear_history, methods=["POST"]),
         Route("/health", health),
+        Route("/static/view.html", view_http),  # Pre-gzipped, ahead of the StaticFiles mount
         Mount("/static", StaticFiles(directory=str(static_dir)), name="static"),
     ]
 
@@ -172,13 +175,21 @@ def create_app() -> Starlette:
     )
 
 
-def run_server(host: str = "0.0.0.0", port: int = 3004, log_level: str = "info") -> None:
+def run_server(
+    host: str = "0.0.0.0",
+    port: int = 3004,
+    log_level: str = "info",
+    loop: str = "auto",
+    http: str = "auto",
+) -> None:
     """Run the agent server.
 
     Args:
         host: Host to bind to
         port: Port to listen on
         log_level: Uvicorn log level
+        loop: Uvicorn event loop implementation ("auto", "asyncio", "uvloop")
+        http: Uvicorn HTTP protocol implementation ("auto", "h11", "httptools")
     """
     import uvicorn
 
@@ -190,4 +201,6 @@ def run_server(host: str = "0.0.0.0", port: int = 3004, log_level: str = "info")
         host=host,
         port=port,
         log_level=log_level,
+        loop=loop,
+        http=http,
     )
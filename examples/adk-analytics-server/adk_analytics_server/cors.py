@@ -0,0 +1,84 @@
+"""Minimal wildcard CORS middleware for the MCP HTTP endpoint."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+Scope = dict[str, Any]
+Message = dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+class FastCORS:
+    """ASGI middleware that allows any origin, method, and header.
+
+    Equivalent to Starlette's ``CORSMiddleware`` configured with ``"*"`` for
+    origins, methods, and headers, but with the response headers computed once
+    up front. Since every origin is allowed there is no per-request matching;
+    preflights only echo back the requested headers, as a literal ``*`` does
+    not cover ``Authorization``.
+    """
+
+    def __init__(self, app: ASGIApp, max_age: int = 86400):
+        """Wrap an ASGI application.
+
+        Args:
+            app: The ASGI application to wrap
+            max_age: Seconds browsers may cache preflight responses
+        """
+        self.app = app
+        self._preflight_headers = [
+            (b"access-control-allow-origin", b"*"),
+            (b"access-control-allow-methods", b"*"),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"content-length", b"0"),
+        ]
+        self._simple_headers = [(b"access-control-allow-origin", b"*")]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            requested_headers = _preflight_request_headers(scope)
+            if requested_headers is not None:
+                await self._preflight(send, requested_headers)
+                return
+
+        simple_headers = self._simple_headers
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *simple_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, send: Send, requested_headers: bytes) -> None:
+        """Answer a preflight, allowing whichever headers the browser asked for."""
+        headers = self._preflight_headers
+        if requested_headers:
+            headers = [*headers, (b"access-control-allow-headers", requested_headers)]
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+
+def _preflight_request_headers(scope: Scope) -> bytes | None:
+    """Get the Access-Control-Request-Headers of a CORS preflight.
+
+    Returns:
+        The requested headers (empty if none were listed), or None if the
+        OPTIONS request is not a preflight
+    """
+    is_preflight = False
+    requested_headers = b""
+    for name, value in scope["headers"]:
+        if name == b"access-control-request-method":
+            is_preflight = True
+        elif name == b"access-control-request-headers":
+            requested_headers = value
+    return requested_headers if is_preflight else None
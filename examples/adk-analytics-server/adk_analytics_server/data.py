@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import os
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-
-import requests
+from typing import TYPE_CHECKING
 
 from .logging import get_logger, log_data_fetch
 
+if TYPE_CHECKING:
+    import asyncio
+
+    import httpx
+
 # Module logger
 logger = get_logger("data")
 
@@ -16,9 +22,21 @@ logger = get_logger("data")
 TIINGO_API_TOKEN = os.environ.get("TIINGO_API_TOKEN")
 TIINGO_BASE_URL = "https://api.tiingo.com"
 
-# Simple in-memory cache for stock data (cache_key -> (timestamp, data))
-_stock_cache: dict[str, tuple[float, list[dict]]] = {}
+# Bounded in-memory LRU cache for stock data ((symbol, days) -> (monotonic time, data))
+_stock_cache: OrderedDict[tuple[str, int], tuple[float, list[dict]]] = OrderedDict()
 _CACHE_TTL_SECONDS = 300  # 5 minutes
+_CACHE_MAX_ENTRIES = 512
+
+# Fetches currently in progress, so concurrent callers for the same key share one request
+_inflight_fetches: dict[tuple[str, int], asyncio.Task[list[dict]]] = {}
+
+# Tiingo daily bars are stamped at midnight UTC, so epoch ms follow from the date alone
+_MS_PER_DAY = 86_400_000
+
+# Shared connection pool for Tiingo (created lazily, closed on server shutdown)
+# and the event loop it belongs to
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
 
 
 class TiingoConfigError(Exception):
@@ -33,7 +51,47 @@ class TiingoAPIError(Exception):
     pass
 
 
-def fetch_stock_data_from_tiingo(symbol: str, days: int = 60) -> list[dict]:
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared Tiingo HTTP client, creating it on first use.
+
+    The client's connections belong to the event loop that created it, so a
+    new client is built when called from a different loop (e.g. a second
+    asyncio.run() in the same process).
+    """
+    import asyncio
+
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop:
+        import httpx
+
+        _http_client = httpx.AsyncClient(
+            base_url=TIINGO_BASE_URL,
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Token {TIINGO_API_TOKEN}",
+            },
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            timeout=10.0,
+            http2=True,
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Tiingo HTTP client."""
+    import asyncio
+
+    global _http_client, _http_client_loop
+    client, loop = _http_client, _http_client_loop
+    _http_client = _http_client_loop = None
+    # A client from another (finished) loop can't be closed here; it is just dropped
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+
+
+async def fetch_stock_data_from_tiingo(symbol: str, days: int = 60) -> list[dict]:
     """Fetch real stock data from Tiingo API.
 
     Args:
@@ -47,6 +105,11 @@ def fetch_stock_data_from_tiingo(symbol: str, days: int = 60) -> list[dict]:
         TiingoConfigError: If TIINGO_API_TOKEN is not set
         TiingoAPIError: If API request fails
     """
+    # Imported here so CLI startup (e.g. --help, STDIO spawn) doesn't pay for them
+    import httpx
+    import numpy as np
+    import orjson
+
     if not TIINGO_API_TOKEN:
         raise TiingoConfigError(
             "TIINGO_API_TOKEN environment variable not set. "
@@ -57,23 +120,18 @@ def fetch_stock_data_from_tiingo(symbol: str, days: int = 60) -> list[dict]:
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days + 30)
 
-    url = f"{TIINGO_BASE_URL}/tiingo/daily/{symbol}/prices"
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Token {TIINGO_API_TOKEN}",
-    }
     params = {
         "startDate": start_date.strftime("%Y-%m-%d"),
         "endDate": end_date.strftime("%Y-%m-%d"),
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-    except requests.exceptions.Timeout:
+        response = await _get_http_client().get(f"/tiingo/daily/{symbol}/prices", params=params)
+    except httpx.TimeoutException:
         raise TiingoAPIError(f"Tiingo API timeout fetching {symbol} - try again later")
-    except requests.exceptions.ConnectionError as e:
+    except httpx.ConnectError as e:
         raise TiingoAPIError(f"Tiingo API connection error: {e}")
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         raise TiingoAPIError(f"Tiingo API request failed: {e}")
 
     # Handle HTTP errors with specific messages
@@ -89,36 +147,48 @@ def fetch_stock_data_from_tiingo(symbol: str, days: int = 60) -> list[dict]:
         raise TiingoAPIError(
             "Tiingo API rate limit exceeded - wait a minute and try again"
         )
-    elif not response.ok:
+    elif not response.is_success:
         raise TiingoAPIError(
             f"Tiingo API error {response.status_code}: {response.text[:200]}"
         )
 
-    raw_data = response.json()
+    raw_data = orjson.loads(response.content)
 
     if not raw_data:
         raise TiingoAPIError(
             f"No data returned for {symbol} - the symbol may be delisted or invalid"
         )
 
-    # Transform to our format and take only the last N trading days
+    # Take only the last N trading days and round/convert each column in one pass
+    rows = raw_data[-days:]
+    prices = np.round(
+        np.array([(r["adjOpen"], r["adjHigh"], r["adjLow"], r["adjClose"]) for r in rows], dtype=np.float64),
+        2,
+    )
+    opens, highs, lows, closes = prices.T.tolist()
+    volumes = np.array([r["adjVolume"] for r in rows], dtype=np.float64).astype(np.int64).tolist()
+    dates = [r["date"][:10] for r in rows]  # "2024-01-15T00:00:00+00:00" -> "2024-01-15"
+    timestamps = (np.array(dates, dtype="datetime64[D]").astype(np.int64) * _MS_PER_DAY).tolist()
+
+    # Transform to our format
     data = []
-    for row in raw_data[-days:]:
-        date_str = row["date"][:10]  # "2024-01-15T00:00:00+00:00" -> "2024-01-15"
+    for date_str, timestamp, open_, high, low, close, volume in zip(
+        dates, timestamps, opens, highs, lows, closes, volumes
+    ):
         data.append({
             "date": date_str,
-            "timestamp": int(datetime.fromisoformat(row["date"].replace("Z", "+00:00")).timestamp() * 1000),
-            "open": round(row["adjOpen"], 2),
-            "high": round(row["adjHigh"], 2),
-            "low": round(row["adjLow"], 2),
-            "close": round(row["adjClose"], 2),
-            "volume": int(row["adjVolume"]),
+            "timestamp": timestamp,
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
         })
 
     return data
 
 
-def get_stock_data(symbol: str, days: int = 60) -> list[dict]:
+async def get_stock_data(symbol: str, days: int = 60) -> list[dict]:
     """Get stock data with caching.
 
     Args:
@@ -132,19 +202,79 @@ def get_stock_data(symbol: str, days: int = 60) -> list[dict]:
         TiingoConfigError: If TIINGO_API_TOKEN is not set
         TiingoAPIError: If API request fails
     """
-    cache_key = f"{symbol}:{days}"
-    now = datetime.now().timestamp()
+    import asyncio
+
+    cache_key = (symbol, days)
+    now = time.monotonic()
 
     # Check cache
-    if cache_key in _stock_cache:
-        cached_time, cached_data = _stock_cache[cache_key]
-        if now - cached_time < _CACHE_TTL_SECONDS:
-            logger.debug(f"Cache hit for {symbol} ({days} days)")
-            return cached_data
-
-    # Fetch from Tiingo (will raise on error)
-    data = fetch_stock_data_from_tiingo(symbol, days)
-    _stock_cache[cache_key] = (now, data)
+    entry = _stock_cache.get(cache_key)
+    if entry is not None and now - entry[0] < _CACHE_TTL_SECONDS:
+        _stock_cache.move_to_end(cache_key)
+        logger.debug(f"Cache hit for {symbol} ({days} days)")
+        return entry[1]
+
+    # Fetch from Tiingo (will raise on error), joining a fetch already in flight.
+    # Shielded so one caller being cancelled doesn't cancel the others' fetch.
+    task = _inflight_fetches.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_and_cache(symbol, days))
+        _inflight_fetches[cache_key] = task
+        task.add_done_callback(lambda _: _inflight_fetches.pop(cache_key, None))
+    else:
+        logger.debug(f"Joining in-flight fetch for {symbol} ({days} days)")
+    return await asyncio.shield(task)
+
+
+async def _fetch_and_cache(symbol: str, days: int) -> list[dict]:
+    """Fetch stock data from Tiingo and store it in the cache."""
+    data = await fetch_stock_data_from_tiingo(symbol, days)
+    cache_key = (symbol, days)
+    _stock_cache[cache_key] = (time.monotonic(), data)
+    _stock_cache.move_to_end(cache_key)
+    if len(_stock_cache) > _CACHE_MAX_ENTRIES:
+        _stock_cache.popitem(last=False)
     log_data_fetch(logger, symbol, "tiingo", days, success=True)
 
     return data
+
+
+async def get_stock_data_many(symbols: list[str], days: int = 60) -> dict[str, list[dict]]:
+    """Get stock data for several symbols concurrently.
+
+    Each symbol goes through get_stock_data(), so cached symbols skip the network
+    and uncached ones are fetched from Tiingo in parallel.
+
+    Args:
+        symbols: Stock ticker symbols (duplicates are fetched once)
+        days: Number of trading days of historical data
+
+    Returns:
+        Mapping of symbol to list of OHLCV dictionaries
+
+    Raises:
+        TiingoConfigError: If TIINGO_API_TOKEN is not set
+        TiingoAPIError: If any symbol fails to fetch (the first failure is raised
+            once all fetches have settled)
+    """
+    import asyncio
+
+    unique_symbols = list(dict.fromkeys(symbols))
+    results = await asyncio.gather(
+        *(get_stock_data(symbol, days) for symbol in unique_symbols),
+        return_exceptions=True,
+    )
+
+    stock_data: dict[str, list[dict]] = {}
+    first_error: BaseException | None = None
+    for symbol, result in zip(unique_symbols, results):
+        if isinstance(result, BaseException):
+            log_data_fetch(logger, symbol, "tiingo", days, success=False)
+            logger.warning(f"Failed to fetch {symbol}: {result}")
+            first_error = first_error or result
+        else:
+            stock_data[symbol] = result
+
+    if first_error is not None:
+        raise first_error
+    return stock_data
@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
-import math
+from collections import OrderedDict
+
+import numpy as np
+
+# Memoized indicators keyed on (id, length, last timestamp) of the data list.
+# get_stock_data() returns the same list object on cache hits, so repeated tool
+# calls for a symbol reuse the result. Entries keep a reference to the list so
+# its id cannot be recycled while cached.
+_indicator_cache: OrderedDict[tuple[int, int, int | None], tuple[list[dict], dict]] = OrderedDict()
+_INDICATOR_CACHE_MAX_ENTRIES = 256
 
 
 def calculate_technical_indicators(data: list[dict]) -> dict:
@@ -19,58 +28,39 @@ def calculate_technical_indicators(data: list[dict]) -> dict:
         - bollingerBands: lower, middle, upper bands
         - currentPrice, priceChange, priceChangePercent
     """
-    closes = [d["close"] for d in data]
-
-    def sma(prices: list[float], period: int) -> float | None:
-        """Calculate Simple Moving Average."""
-        if len(prices) < period:
-            return None
-        return sum(prices[-period:]) / period
-
-    def calculate_rsi(prices: list[float], period: int = 14) -> float | None:
-        """Calculate Relative Strength Index."""
-        if len(prices) < period + 1:
-            return None
-        gains = []
-        losses = []
-        for i in range(1, len(prices)):
-            change = prices[i] - prices[i - 1]
-            gains.append(max(0, change))
-            losses.append(max(0, -change))
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
-        if avg_loss == 0:
-            return 100
-        rs = avg_gain / avg_loss
-        return round(100 - (100 / (1 + rs)), 2)
-
-    def calculate_macd(prices: list[float]) -> tuple[float | None, float | None, float | None]:
-        """Calculate MACD (simplified version using SMA instead of EMA)."""
-        if len(prices) < 26:
-            return None, None, None
-        ema12 = sum(prices[-12:]) / 12
-        ema26 = sum(prices[-26:]) / 26
-        macd_line = ema12 - ema26
-        signal = macd_line * 0.9  # Simplified signal line
-        histogram = macd_line - signal
-        return round(macd_line, 4), round(signal, 4), round(histogram, 4)
-
-    def bollinger_bands(prices: list[float], period: int = 20) -> tuple[float | None, float | None, float | None]:
-        """Calculate Bollinger Bands."""
-        if len(prices) < period:
-            return None, None, None
-        sma_val = sum(prices[-period:]) / period
-        variance = sum((p - sma_val) ** 2 for p in prices[-period:]) / period
-        std_dev = math.sqrt(variance)
-        return round(sma_val - 2 * std_dev, 2), round(sma_val, 2), round(sma_val + 2 * std_dev, 2)
-
-    macd_line, macd_signal, macd_histogram = calculate_macd(closes)
-    bb_lower, bb_middle, bb_upper = bollinger_bands(closes)
+    if not data:
+        return _compute_indicators(data)
+
+    key = (id(data), len(data), data[-1].get("timestamp"))
+    entry = _indicator_cache.get(key)
+    if entry is not None and entry[0] is data:
+        _indicator_cache.move_to_end(key)
+        return entry[1]
+
+    indicators = _compute_indicators(data)
+    _indicator_cache[key] = (data, indicators)
+    _indicator_cache.move_to_end(key)
+    if len(_indicator_cache) > _INDICATOR_CACHE_MAX_ENTRIES:
+        _indicator_cache.popitem(last=False)
+    return indicators
+
+
+def _compute_indicators(data: list[dict]) -> dict:
+    """Compute indicators for calculate_technical_indicators() without caching."""
+    # Build the close series once; every indicator below works on views of it
+    closes = np.fromiter((d["close"] for d in data), dtype=np.float64, count=len(data))
+
+    macd_line, macd_signal, macd_histogram = _macd(closes)
+    bb_lower, bb_middle, bb_upper = _bollinger_bands(closes)
+    sma20 = _sma(closes, 20)
+    sma50 = _sma(closes, 50)
+    first_close = closes[0].item() if len(closes) else None
+    last_close = closes[-1].item() if len(closes) else None
 
     return {
-        "sma20": round(sma(closes, 20), 2) if sma(closes, 20) else None,
-        "sma50": round(sma(closes, 50), 2) if sma(closes, 50) else None,
-        "rsi": calculate_rsi(closes),
+        "sma20": round(sma20, 2) if sma20 is not None else None,
+        "sma50": round(sma50, 2) if sma50 is not None else None,
+        "rsi": _rsi(closes),
         "macd": {
             "line": macd_line,
             "signal": macd_signal,
@@ -81,12 +71,164 @@ def calculate_technical_indicators(data: list[dict]) -> dict:
             "middle": bb_middle,
             "upper": bb_upper,
         },
-        "currentPrice": closes[-1] if closes else None,
-        "priceChange": round(closes[-1] - closes[0], 2) if len(closes) > 1 else 0,
-        "priceChangePercent": round((closes[-1] - closes[0]) / closes[0] * 100, 2) if len(closes) > 1 else 0,
+        "currentPrice": last_close,
+        "priceChange": round(last_close - first_close, 2) if len(closes) > 1 else 0,
+        "priceChangePercent": round((last_close - first_close) / first_close * 100, 2) if len(closes) > 1 else 0,
     }
 
 
+def _sma(prices: np.ndarray, period: int) -> float | None:
+    """Calculate Simple Moving Average."""
+    if len(prices) < period:
+        return None
+    return prices[-period:].mean().item()
+
+
+def _rsi(prices: np.ndarray, period: int = 14) -> float | None:
+    """Calculate Relative Strength Index with Wilder's smoothing."""
+    if len(prices) < period + 1:
+        return None
+    changes = np.diff(prices)
+    gains = np.maximum(changes, 0)
+    losses = np.maximum(-changes, 0)
+
+    # Seed with the simple average of the first period, then smooth the rest
+    avg_gain = gains[:period].mean().item()
+    avg_loss = losses[:period].mean().item()
+    for gain, loss in zip(gains[period:].tolist(), losses[period:].tolist()):
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    if avg_loss == 0:
+        return 100
+    rs = avg_gain / avg_loss
+    return round(100 - (100 / (1 + rs)), 2)
+
+
+def _ema(prices: np.ndarray, span: int) -> np.ndarray:
+    """Calculate the Exponential Moving Average series, seeded with the first price.
+
+    Each value depends on the previous one, so this is a loop rather than a
+    NumPy expression; it runs over plain floats to keep it cheap.
+    """
+    alpha = 2 / (span + 1)
+    out = np.empty_like(prices)
+    value = prices[0].item()
+    for i, price in enumerate(prices.tolist()):
+        value += alpha * (price - value)
+        out[i] = value
+    return out
+
+
+def _macd(prices: np.ndarray) -> tuple[float | None, float | None, float | None]:
+    """Calculate MACD (12/26 EMA) with a 9-period EMA signal line."""
+    if len(prices) < 26:
+        return None, None, None
+    macd_series = _ema(prices, 12) - _ema(prices, 26)
+    macd_line = macd_series[-1].item()
+    signal = _ema(macd_series, 9)[-1].item()
+    histogram = macd_line - signal
+    return round(macd_line, 4), round(signal, 4), round(histogram, 4)
+
+
+def _bollinger_bands(prices: np.ndarray, period: int = 20) -> tuple[float | None, float | None, float | None]:
+    """Calculate Bollinger Bands."""
+    if len(prices) < period:
+        return None, None, None
+    window = prices[-period:]
+    sma_val = window.mean().item()
+    std_dev = window.std().item()
+    return round(sma_val - 2 * std_dev, 2), round(sma_val, 2), round(sma_val + 2 * std_dev, 2)
+
+
+# Insight rules: (predicate, template). Templates are copied per insight, with
+# "{value}" in the description filled in from the indicator value.
+_RSI_RULES = (
+    (lambda rsi: rsi > 70, {
+        "type": "warning",
+        "indicator": "RSI",
+        "title": "Overbought Signal",
+        "description": "RSI at {value} indicates overbought conditions. Consider taking profits or waiting for a pullback.",
+        "confidence": 0.75,
+    }),
+    (lambda rsi: rsi < 30, {
+        "type": "opportunity",
+        "indicator": "RSI",
+        "title": "Oversold Signal",
+        "description": "RSI at {value} indicates oversold conditions. Potential buying opportunity if fundamentals are strong.",
+        "confidence": 0.72,
+    }),
+    (lambda rsi: True, {
+        "type": "neutral",
+        "indicator": "RSI",
+        "title": "Neutral Momentum",
+        "description": "RSI at {value} is in neutral territory. No strong momentum signals.",
+        "confidence": 0.68,
+    }),
+)
+
+_MACD_RULES = (
+    (lambda histogram: histogram > 0, {
+        "type": "bullish",
+        "indicator": "MACD",
+        "title": "Bullish Momentum",
+        "description": "MACD histogram is positive, indicating bullish momentum. The trend may continue upward.",
+        "confidence": 0.70,
+    }),
+    (lambda histogram: True, {
+        "type": "bearish",
+        "indicator": "MACD",
+        "title": "Bearish Momentum",
+        "description": "MACD histogram is negative, indicating bearish momentum. Watch for potential reversal signals.",
+        "confidence": 0.70,
+    }),
+)
+
+_PRICE_RULES = (
+    (lambda change_pct: change_pct > 10, {
+        "type": "alert",
+        "indicator": "Price",
+        "title": "Significant Gain",
+        "description": "Stock has moved {value:.1f}% over the analysis period. High volatility detected.",
+        "confidence": 0.85,
+    }),
+    (lambda change_pct: change_pct < -10, {
+        "type": "alert",
+        "indicator": "Price",
+        "title": "Significant Loss",
+        "description": "Stock has moved {value:.1f}% over the analysis period. High volatility detected.",
+        "confidence": 0.85,
+    }),
+)
+
+_BOLLINGER_RULES = (
+    (lambda price_band: price_band[0] > price_band[1]["upper"], {
+        "type": "warning",
+        "indicator": "Bollinger Bands",
+        "title": "Above Upper Band",
+        "description": "Price is trading above the upper Bollinger Band. May indicate overextension.",
+        "confidence": 0.65,
+    }),
+    (lambda price_band: price_band[0] < price_band[1]["lower"], {
+        "type": "opportunity",
+        "indicator": "Bollinger Bands",
+        "title": "Below Lower Band",
+        "description": "Price is trading below the lower Bollinger Band. Potential mean reversion opportunity.",
+        "confidence": 0.65,
+    }),
+)
+
+
+def _first_match(rules: tuple, value, display=None) -> dict | None:
+    """Build the insight for the first rule whose predicate matches value."""
+    for predicate, template in rules:
+        if predicate(value):
+            insight = template.copy()
+            insight["description"] = insight["description"].format(value=value if display is None else display)
+            return insight
+    return None
+
+
 def generate_ai_insights(symbol: str, indicators: dict) -> list[dict]:
     """Generate AI-powered trading insights based on technical indicators.
 
@@ -97,86 +239,16 @@ def generate_ai_insights(symbol: str, indicators: dict) -> list[dict]:
     Returns:
         List of insight dictionaries with type, indicator, title, description, confidence
     """
-    insights = []
-
-    # RSI insight
     rsi = indicators.get("rsi")
-    if rsi:
-        if rsi > 70:
-            insights.append({
-                "type": "warning",
-                "indicator": "RSI",
-                "title": "Overbought Signal",
-                "description": f"RSI at {rsi} indicates overbought conditions. Consider taking profits or waiting for a pullback.",
-                "confidence": 0.75,
-            })
-        elif rsi < 30:
-            insights.append({
-                "type": "opportunity",
-                "indicator": "RSI",
-                "title": "Oversold Signal",
-                "description": f"RSI at {rsi} indicates oversold conditions. Potential buying opportunity if fundamentals are strong.",
-                "confidence": 0.72,
-            })
-        else:
-            insights.append({
-                "type": "neutral",
-                "indicator": "RSI",
-                "title": "Neutral Momentum",
-                "description": f"RSI at {rsi} is in neutral territory. No strong momentum signals.",
-                "confidence": 0.68,
-            })
-
-    # MACD insight
-    macd = indicators.get("macd", {})
-    if macd.get("histogram"):
-        if macd["histogram"] > 0:
-            insights.append({
-                "type": "bullish",
-                "indicator": "MACD",
-                "title": "Bullish Momentum",
-                "description": "MACD histogram is positive, indicating bullish momentum. The trend may continue upward.",
-                "confidence": 0.70,
-            })
-        else:
-            insights.append({
-                "type": "bearish",
-                "indicator": "MACD",
-                "title": "Bearish Momentum",
-                "description": "MACD histogram is negative, indicating bearish momentum. Watch for potential reversal signals.",
-                "confidence": 0.70,
-            })
-
-    # Price change insight
+    histogram = indicators.get("macd", {}).get("histogram")
     change_pct = indicators.get("priceChangePercent", 0)
-    if abs(change_pct) > 10:
-        insights.append({
-            "type": "alert",
-            "indicator": "Price",
-            "title": f"Significant {'Gain' if change_pct > 0 else 'Loss'}",
-            "description": f"Stock has moved {abs(change_pct):.1f}% over the analysis period. High volatility detected.",
-            "confidence": 0.85,
-        })
-
-    # Bollinger Band insight
     bb = indicators.get("bollingerBands", {})
     current = indicators.get("currentPrice")
-    if bb.get("upper") and current:
-        if current > bb["upper"]:
-            insights.append({
-                "type": "warning",
-                "indicator": "Bollinger Bands",
-                "title": "Above Upper Band",
-                "description": "Price is trading above the upper Bollinger Band. May indicate overextension.",
-                "confidence": 0.65,
-            })
-        elif current < bb["lower"]:
-            insights.append({
-                "type": "opportunity",
-                "indicator": "Bollinger Bands",
-                "title": "Below Lower Band",
-                "description": "Price is trading below the lower Bollinger Band. Potential mean reversion opportunity.",
-                "confidence": 0.65,
-            })
-
-    return insights
+
+    candidates = (
+        _first_match(_RSI_RULES, rsi) if rsi else None,
+        _first_match(_MACD_RULES, histogram) if histogram else None,
+        _first_match(_PRICE_RULES, change_pct, abs(change_pct)),
+        _first_match(_BOLLINGER_RULES, (current, bb)) if bb.get("upper") and current else None,
+    )
+    return [insight for insight in candidates if insight is not None]
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any, AsyncIterator
 
-from .base import Event, LLMProvider, Message, Tool, ToolCall
+import orjson
+
+from .base import Event, LLMProvider, Message, Tool, ToolCall, with_chunk_timeout
 
 
 class AnthropicProvider(LLMProvider):
@@ -33,6 +36,9 @@ class AnthropicProvider(LLMProvider):
 
         self._client = anthropic.AsyncAnthropic(api_key=self._api_key)
 
+        # System prompt -> cacheable system content blocks, built once per prompt
+        self._system_blocks: dict[str, list[dict[str, Any]]] = {}
+
     @property
     def name(self) -> str:
         return "anthropic"
@@ -41,39 +47,46 @@ class AnthropicProvider(LLMProvider):
     def model(self) -> str:
         return self._model
 
-    def _convert_messages(self, messages: list[Message]) -> list[dict[str, Any]]:
-        """Convert our messages to Anthropic format."""
-        result = []
-        for msg in messages:
-            if msg.role == "system":
-                # System messages handled separately in Anthropic
-                continue
-            elif msg.role == "tool":
-                # Tool results in Anthropic format
-                result.append({
-                    "role": "user",
-                    "content": [{
-                        "type": "tool_result",
-                        "tool_use_id": msg.tool_call_id,
-                        "content": msg.content,
-                    }],
+    def _convert_message(self, msg: Message) -> dict[str, Any]:
+        """Convert one of our messages to Anthropic format."""
+        if msg.role == "tool":
+            # Tool results in Anthropic format
+            return {
+                "role": "user",
+                "content": [{
+                    "type": "tool_result",
+                    "tool_use_id": msg.tool_call_id,
+                    "content": msg.content,
+                }],
+            }
+        elif msg.role == "assistant" and msg.tool_calls:
+            # Assistant message with tool calls
+            content = []
+            if msg.content:
+                content.append({"type": "text", "text": msg.content})
+            for tc in msg.tool_calls:
+                content.append({
+                    "type": "tool_use",
+                    "id": tc.id,
+                    "name": tc.name,
+                    "input": tc.arguments,
                 })
-            elif msg.role == "assistant" and msg.tool_calls:
-                # Assistant message with tool calls
-                content = []
-                if msg.content:
-                    content.append({"type": "text", "text": msg.content})
-                for tc in msg.tool_calls:
-                    content.append({
-                        "type": "tool_use",
-                        "id": tc.id,
-                        "name": tc.name,
-                        "input": tc.arguments,
-                    })
-                result.append({"role": "assistant", "content": content})
-            else:
-                result.append({"role": msg.role, "content": msg.content})
-        return result
+            return {"role": "assistant", "content": content}
+        else:
+            return {"role": msg.role, "content": msg.content}
+
+    def _convert_system(self, system: str) -> list[dict[str, Any]]:
+        """Convert a system prompt to content blocks marked for prompt caching.
+
+        The system prompt is identical on every turn, so marking it with
+        ``cache_control`` lets the API reuse the prefilled tools + system prefix
+        instead of reprocessing it for each request.
+        """
+        blocks = self._system_blocks.get(system)
+        if blocks is None:
+            blocks = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+            self._system_blocks[system] = blocks
+        return blocks
 
     def _convert_tools(self, tools: list[Tool]) -> list[dict[str, Any]]:
         """Convert tools to Anthropic format."""
@@ -95,38 +108,31 @@ class AnthropicProvider(LLMProvider):
         """Stream a chat completion."""
         import anthropic
 
-        # Extract system message if present
-        system_prompt = system
-        for msg in messages:
-            if msg.role == "system":
-                system_prompt = msg.content
-                break
-
         # Build request
         request_params: dict[str, Any] = {
             "model": self._model,
             "max_tokens": 4096,
-            "messages": self._convert_messages(messages),
+            "messages": self._converted_messages(messages),
         }
 
-        if system_prompt:
-            request_params["system"] = system_prompt
+        if system:
+            request_params["system"] = self._convert_system(system)
 
         if tools:
-            request_params["tools"] = self._convert_tools(tools)
+            request_params["tools"] = self._converted_tools(tools)
 
         try:
             async with self._client.messages.stream(**request_params) as stream:
                 current_tool_call: dict[str, Any] | None = None
 
-                async for event in stream:
+                async for event in with_chunk_timeout(stream, self.chunk_timeout):
                     if event.type == "content_block_start":
                         block = event.content_block
                         if block.type == "tool_use":
                             current_tool_call = {
                                 "id": block.id,
                                 "name": block.name,
-                                "arguments_json": "",
+                                "arguments_chunks": [],
                             }
 
                     elif event.type == "content_block_delta":
@@ -135,14 +141,13 @@ class AnthropicProvider(LLMProvider):
                             yield Event(type="text_delta", text=delta.text)
                         elif delta.type == "input_json_delta":
                             if current_tool_call:
-                                current_tool_call["arguments_json"] += delta.partial_json
+                                current_tool_call["arguments_chunks"].append(delta.partial_json)
 
                     elif event.type == "content_block_stop":
                         if current_tool_call:
-                            import json
                             try:
-                                args = json.loads(current_tool_call["arguments_json"])
-                            except json.JSONDecodeError:
+                                args = orjson.loads("".join(current_tool_call["arguments_chunks"]))
+                            except orjson.JSONDecodeError:
                                 args = {}
                             yield Event(
                                 type="tool_call",
@@ -158,3 +163,5 @@ class AnthropicProvider(LLMProvider):
 
         except anthropic.APIError as e:
             yield Event(type="error", error=f"Anthropic API error: {e}")
+        except asyncio.TimeoutError:
+            yield Event(type="error", error=f"Anthropic stream stalled (no data for {self.chunk_timeout:g}s)")
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Literal
+from typing import Any, AsyncIterable, AsyncIterator, Literal, TypeVar
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -55,9 +58,36 @@ class Event:
     error: str | None = None
 
 
+async def with_chunk_timeout(stream: AsyncIterable[T], timeout: float) -> AsyncIterator[T]:
+    """Iterate a provider stream, giving up if the next chunk takes too long.
+
+    Args:
+        stream: Streaming response from a provider SDK
+        timeout: Seconds to wait for each chunk
+
+    Raises:
+        asyncio.TimeoutError: If no chunk arrives within timeout seconds
+    """
+    iterator = aiter(stream)
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(anext(iterator), timeout)
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # Seconds to wait for the next streamed chunk before treating the stream as stalled
+    chunk_timeout: float = 60.0
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -80,7 +110,7 @@ class LLMProvider(ABC):
         """Stream a chat completion with optional tool use.
 
         Args:
-            messages: Conversation history
+            messages: Conversation history (system messages in it are ignored)
             tools: Available tools (optional)
             system: System prompt (optional)
 
@@ -89,6 +119,56 @@ class LLMProvider(ABC):
         """
         pass
 
+    # Last (tools, converted tools) pair, see _converted_tools()
+    _tools_cache: tuple[list[Tool], Any] | None = None
+
+    @abstractmethod
+    def _convert_tools(self, tools: list[Tool]) -> Any:
+        """Convert tools to the provider's request format."""
+        pass
+
+    def _converted_tools(self, tools: list[Tool]) -> Any:
+        """Get _convert_tools() output, reusing it while the same list is passed.
+
+        Agent passes MCPClient's cached tool list on every turn, so tools are
+        only converted again when a new list comes in.
+        """
+        cached = self._tools_cache
+        if cached is None or cached[0] is not tools:
+            cached = (tools, self._convert_tools(tools))
+            self._tools_cache = cached
+        return cached[1]
+
+    # id(message) -> (message, content, converted message), see _converted_messages()
+    _message_cache: dict[int, tuple[Message, str, Any]] | None = None
+
+    @abstractmethod
+    def _convert_message(self, msg: Message) -> Any:
+        """Convert one non-system message to the provider's format."""
+        pass
+
+    def _converted_messages(self, messages: list[Message]) -> list[Any]:
+        """Convert messages, reusing conversions from earlier turns.
+
+        The agent re-sends its whole history on every turn, so only messages
+        that are new, or whose content has changed (e.g. truncated by history
+        trimming), are converted again. System messages are skipped; the
+        system prompt is sent separately.
+        """
+        cache = self._message_cache or {}
+        new_cache = {}
+        result = []
+        for msg in messages:
+            if msg.role == "system":
+                continue
+            entry = cache.get(id(msg))
+            if entry is None or entry[0] is not msg or entry[1] is not msg.content:
+                entry = (msg, msg.content, self._convert_message(msg))
+            new_cache[id(msg)] = entry
+            result.append(entry[2])
+        self._message_cache = new_cache  # Drops messages no longer in the history
+        return result
+
     def _convert_tool_to_schema(self, tool: Tool) -> dict[str, Any]:
         """Convert our Tool to provider-specific format. Override in subclasses."""
         return {
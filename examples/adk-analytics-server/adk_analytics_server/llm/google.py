@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any, AsyncIterator
 
-from .base import Event, LLMProvider, Message, Tool, ToolCall
+from .base import Event, LLMProvider, Message, Tool, ToolCall, with_chunk_timeout
 
 
 class GoogleProvider(LLMProvider):
@@ -41,50 +42,38 @@ class GoogleProvider(LLMProvider):
     def model(self) -> str:
         return self._model
 
-    def _convert_messages(self, messages: list[Message]) -> list[dict[str, Any]]:
-        """Convert our messages to Gemini format."""
+    def _convert_message(self, msg: Message) -> Any:
+        """Convert one of our messages to Gemini format."""
         from google.genai import types
 
-        result = []
-        for msg in messages:
-            if msg.role == "system":
-                # System messages handled separately
-                continue
-            elif msg.role == "tool":
-                # Tool results
-                result.append(
-                    types.Content(
-                        role="user",
-                        parts=[
-                            types.Part.from_function_response(
-                                name=msg.tool_call_id or "unknown",
-                                response={"result": msg.content},
-                            )
-                        ],
+        if msg.role == "tool":
+            # Tool results
+            return types.Content(
+                role="user",
+                parts=[
+                    types.Part.from_function_response(
+                        name=msg.tool_call_id or "unknown",
+                        response={"result": msg.content},
                     )
-                )
-            elif msg.role == "assistant" and msg.tool_calls:
-                # Assistant with tool calls
-                parts = []
-                if msg.content:
-                    parts.append(types.Part(text=msg.content))
-                for tc in msg.tool_calls:
-                    parts.append(
-                        types.Part.from_function_call(
-                            name=tc.name,
-                            args=tc.arguments,
-                        )
+                ],
+            )
+        elif msg.role == "assistant" and msg.tool_calls:
+            # Assistant with tool calls
+            parts = []
+            if msg.content:
+                parts.append(types.Part(text=msg.content))
+            for tc in msg.tool_calls:
+                parts.append(
+                    types.Part.from_function_call(
+                        name=tc.name,
+                        args=tc.arguments,
                     )
-                result.append(types.Content(role="model", parts=parts))
-            elif msg.role == "assistant":
-                result.append(
-                    types.Content(role="model", parts=[types.Part(text=msg.content)])
                 )
-            else:
-                result.append(
-                    types.Content(role="user", parts=[types.Part(text=msg.content)])
-                )
-        return result
+            return types.Content(role="model", parts=parts)
+        elif msg.role == "assistant":
+            return types.Content(role="model", parts=[types.Part(text=msg.content)])
+        else:
+            return types.Content(role="user", parts=[types.Part(text=msg.content)])
 
     def _convert_tools(self, tools: list[Tool]) -> list[Any]:
         """Convert tools to Gemini format."""
@@ -110,29 +99,23 @@ class GoogleProvider(LLMProvider):
         """Stream a chat completion."""
         from google.genai import types
 
-        # Extract system message
-        system_prompt = system
-        for msg in messages:
-            if msg.role == "system":
-                system_prompt = msg.content
-                break
-
         # Build config
         config = types.GenerateContentConfig(
-            system_instruction=system_prompt,
+            system_instruction=system,
         )
         if tools:
-            config.tools = self._convert_tools(tools)
+            config.tools = self._converted_tools(tools)
 
-        contents = self._convert_messages(messages)
+        contents = self._converted_messages(messages)
 
         try:
             # Use streaming
-            async for chunk in await self._client.aio.models.generate_content_stream(
+            stream = await self._client.aio.models.generate_content_stream(
                 model=self._model,
                 contents=contents,
                 config=config,
-            ):
+            )
+            async for chunk in with_chunk_timeout(stream, self.chunk_timeout):
                 if not chunk.candidates:
                     continue
 
@@ -150,11 +133,13 @@ class GoogleProvider(LLMProvider):
                             tool_call=ToolCall(
                                 id=fc.name,  # Gemini uses name as ID
                                 name=fc.name,
-                                arguments=dict(fc.args) if fc.args else {},
+                                arguments=fc.args or {},  # Already a plain dict in google-genai
                             ),
                         )
 
             yield Event(type="done")
 
+        except asyncio.TimeoutError:
+            yield Event(type="error", error=f"Google stream stalled (no data for {self.chunk_timeout:g}s)")
         except Exception as e:
             yield Event(type="error", error=f"Google API error: {e}")
@@ -7,6 +7,7 @@ import os
 from typing import Any, AsyncIterator
 
 import httpx
+import orjson
 
 from .base import Event, LLMProvider, Message, Tool, ToolCall
 
@@ -48,44 +49,33 @@ class OpenRouterProvider(LLMProvider):
     def model(self) -> str:
         return self._model
 
-    def _convert_messages(self, messages: list[Message], system: str | None) -> list[dict[str, Any]]:
-        """Convert our messages to OpenAI format."""
-        result = []
-
-        if system:
-            result.append({"role": "system", "content": system})
-
-        for msg in messages:
-            if msg.role == "system":
-                # Already handled above
-                continue
-            elif msg.role == "tool":
-                result.append({
-                    "role": "tool",
-                    "tool_call_id": msg.tool_call_id,
-                    "content": msg.content,
-                })
-            elif msg.role == "assistant" and msg.tool_calls:
-                tool_calls = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments),
-                        },
-                    }
-                    for tc in msg.tool_calls
-                ]
-                result.append({
-                    "role": "assistant",
-                    "content": msg.content or None,
-                    "tool_calls": tool_calls,
-                })
-            else:
-                result.append({"role": msg.role, "content": msg.content})
-
-        return result
+    def _convert_message(self, msg: Message) -> dict[str, Any]:
+        """Convert one of our messages to OpenAI format."""
+        if msg.role == "tool":
+            return {
+                "role": "tool",
+                "tool_call_id": msg.tool_call_id,
+                "content": msg.content,
+            }
+        elif msg.role == "assistant" and msg.tool_calls:
+            tool_calls = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": json.dumps(tc.arguments),
+                    },
+                }
+                for tc in msg.tool_calls
+            ]
+            return {
+                "role": "assistant",
+                "content": msg.content or None,
+                "tool_calls": tool_calls,
+            }
+        else:
+            return {"role": msg.role, "content": msg.content}
 
     def _convert_tools(self, tools: list[Tool]) -> list[dict[str, Any]]:
         """Convert tools to OpenAI function format."""
@@ -108,20 +98,25 @@ class OpenRouterProvider(LLMProvider):
         system: str | None = None,
     ) -> AsyncIterator[Event]:
         """Stream a chat completion."""
+        converted = self._converted_messages(messages)
+        if system:
+            converted.insert(0, {"role": "system", "content": system})
+
         request_body: dict[str, Any] = {
             "model": self._model,
-            "messages": self._convert_messages(messages, system),
+            "messages": converted,
             "stream": True,
         }
 
         if tools:
-            request_body["tools"] = self._convert_tools(tools)
+            request_body["tools"] = self._converted_tools(tools)
 
         try:
             async with self._client.stream(
                 "POST",
                 "/chat/completions",
-                json=request_body,
+                content=orjson.dumps(request_body),
+                headers={"Content-Type": "application/json"},
             ) as response:
                 if response.status_code != 200:
                     error_text = await response.aread()
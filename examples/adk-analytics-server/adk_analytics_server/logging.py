@@ -2,50 +2,74 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
+import struct
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar
+
+import orjson
 
 # Custom TRACE level for very verbose logging (below DEBUG)
 TRACE_LEVEL = 5
 logging.addLevelName(TRACE_LEVEL, "TRACE")
 
+# LogRecord extras copied into structured log entries
+_EXTRA_FIELDS = (
+    "tool_name",
+    "tool_args",
+    "tool_result",
+    "duration_ms",
+    "symbol",
+    "data_source",
+    "structured_content",
+)
+_MISSING = object()
+
+# Background thread that writes queued records to the log file
+_queue_listener: logging.handlers.QueueListener | None = None
+
 
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured log output."""
 
     def format(self, record: logging.LogRecord) -> str:
+        return orjson.dumps(
+            self.to_dict(record),
+            default=str,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+    def to_dict(self, record: logging.LogRecord) -> dict[str, Any]:
+        """Build the structured log entry for a record."""
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # Emission time recorded on the LogRecord; orjson renders it as ISO 8601
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
-        # Add extra fields if present
-        if hasattr(record, "tool_name"):
-            log_data["tool_name"] = record.tool_name
-        if hasattr(record, "tool_args"):
-            log_data["tool_args"] = record.tool_args
-        if hasattr(record, "tool_result"):
-            log_data["tool_result"] = record.tool_result
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
-        if hasattr(record, "symbol"):
-            log_data["symbol"] = record.symbol
-        if hasattr(record, "data_source"):
-            log_data["data_source"] = record.data_source
-        if hasattr(record, "structured_content"):
-            log_data["structured_content"] = record.structured_content
+        # Add extra fields if present. The seven known keys are probed directly;
+        # scanning all of record.__dict__ against them is about 3x slower.
+        attrs = record.__dict__
+        for key in _EXTRA_FIELDS:
+            value = attrs.get(key, _MISSING)
+            if value is not _MISSING:
+                log_data[key] = value
 
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        return log_data
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -60,41 +84,165 @@ class ConsoleFormatter(logging.Formatter):
         "RESET": "\033[0m",
     }
 
+    # Colored "[LEVEL]" prefixes, built once instead of per record
+    _PREFIXES: ClassVar[MappingProxyType[str, str]] = MappingProxyType({
+        level: f"{color}[{level}]\033[0m"
+        for level, color in COLORS.items()
+        if level != "RESET"
+    })
+
+    # (record attribute, label, unit) shown after the message when present
+    _EXTRA_KEYS: ClassVar[tuple[tuple[str, str, str], ...]] = (
+        ("tool_name", "tool", ""),
+        ("duration_ms", "duration", "ms"),
+        ("symbol", "symbol", ""),
+        ("data_source", "source", ""),
+    )
+
     def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, "")
-        reset = self.COLORS["RESET"]
+        levelname = record.levelname
+        prefix = self._PREFIXES.get(levelname) or f"[{levelname}]"
+        msg = f"{prefix} {record.getMessage()}"
 
-        # Basic message
-        msg = f"{color}[{record.levelname}]{reset} {record.getMessage()}"
+        # TRACE structuredContent travels as an extra and is only serialized here
+        attrs = record.__dict__
+        if "structured_content" in attrs:
+            msg += f": {orjson.dumps(attrs['structured_content'], default=str).decode()}"
 
         # Add extra context for verbose logging
-        extras = []
-        if hasattr(record, "tool_name"):
-            extras.append(f"tool={record.tool_name}")
-        if hasattr(record, "duration_ms"):
-            extras.append(f"duration={record.duration_ms}ms")
-        if hasattr(record, "symbol"):
-            extras.append(f"symbol={record.symbol}")
-        if hasattr(record, "data_source"):
-            extras.append(f"source={record.data_source}")
-
+        extras = [
+            f"{label}={attrs[key]}{unit}"
+            for key, label, unit in self._EXTRA_KEYS
+            if key in attrs
+        ]
         if extras:
             msg += f" ({', '.join(extras)})"
 
         return msg
 
 
+# Formatters are stateless, so one instance of each is shared by every setup_logging() call
+_CONSOLE_FORMATTER = ConsoleFormatter()
+_STRUCTURED_FORMATTER = StructuredFormatter()
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that batches disk writes.
+
+    The file is opened with a 64 KiB buffer and flushed every FLUSH_EVERY
+    records, or straight away for WARNING and above, rather than after every
+    record.
+    """
+
+    BUFFER_SIZE = 65536
+    FLUSH_EVERY = 100
+
+    def __init__(self, filename: Path | str, mode: str = "a", encoding: str | None = None):
+        self._pending = 0
+        self._flush_now = True
+        super().__init__(filename, mode=mode, encoding=encoding)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, buffering=self.BUFFER_SIZE)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._pending += 1
+        self._flush_now = record.levelno >= logging.WARNING or self._pending >= self.FLUSH_EVERY
+        try:
+            self._write(record)
+        finally:
+            self._flush_now = True
+
+    def _write(self, record: logging.LogRecord) -> None:
+        """Write one record and call flush()."""
+        super().emit(record)  # StreamHandler.emit() writes, then calls flush()
+
+    def flush(self) -> None:
+        if self._flush_now:
+            super().flush()
+            self._pending = 0
+
+
+class _MsgpackFileHandler(_BufferedFileHandler):
+    """Buffered file handler writing length-prefixed msgpack records.
+
+    Each record is a 4-byte big-endian length followed by the msgpack-encoded
+    StructuredFormatter entry. Read the file back with
+    ``python -m adk_analytics_server.logreader``.
+    """
+
+    def __init__(self, filename: Path | str, formatter: StructuredFormatter, mode: str = "ab"):
+        """Open a msgpack log file.
+
+        Args:
+            filename: Path to the log file
+            formatter: Builds the entry written for each record
+            mode: File open mode
+        """
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError(
+                "msgpack log format requires msgpack: pip install 'adk-analytics-server[msgpack]'"
+            ) from e
+        self._packb = msgpack.packb
+        super().__init__(filename, mode=mode)
+        self.setFormatter(formatter)
+        self._structured_formatter = formatter
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE)
+
+    def _write(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            payload = self._packb(self._structured_formatter.to_dict(record), default=str, datetime=True)
+            self.stream.write(struct.pack(">I", len(payload)) + payload)
+            self.flush()
+        except (OSError, ValueError, TypeError, struct.error):
+            # Unwritable file, or an entry msgpack can't pack (e.g. an int out of range)
+            self.handleError(record)
+
+
+class _FileQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that hands records to the file writer thread unformatted.
+
+    The stock QueueHandler pre-formats records and drops exc_info; here the
+    message is only interpolated so StructuredFormatter still sees the extras
+    and can emit the exception as its own field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records, stop the file writer thread, and close the file."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
 def setup_logging(
     verbosity: int = 0,
     log_file: Path | str | None = None,
     log_level: str = "INFO",
+    log_format: str = "json",
 ) -> logging.Logger:
     """Configure logging for the server.
 
     Args:
         verbosity: Verbosity level (0=normal, 1=verbose/DEBUG, 2+=very verbose/TRACE)
-        log_file: Path to structured JSON log file (None for no file logging)
+        log_file: Path to structured log file (None for no file logging)
         log_level: Base log level (DEBUG, INFO, WARNING, ERROR)
+        log_format: Log file format, "json" (JSON lines) or "msgpack" (length-prefixed msgpack)
 
     Returns:
         Configured root logger for the package
@@ -114,28 +262,46 @@ def setup_logging(
 
     # Remove existing handlers
     logger.handlers.clear()
+    _stop_queue_listener()
 
     # Console handler with human-readable format
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(level)
-    console_handler.setFormatter(ConsoleFormatter())
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(console_handler)
 
-    # File handler with structured JSON format
+    # File handler with structured format (JSON lines or framed msgpack)
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_path, mode="a", encoding="utf-8")
+        if log_format == "msgpack":
+            file_handler = _MsgpackFileHandler(log_path, _STRUCTURED_FORMATTER)
+        else:
+            file_handler = _BufferedFileHandler(log_path, mode="a", encoding="utf-8")
         file_handler.setLevel(TRACE_LEVEL)  # Log everything including TRACE to file
-        file_handler.setFormatter(StructuredFormatter())
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_STRUCTURED_FORMATTER)
+
+        # Writes happen on a listener thread so logging never blocks on file I/O
+        global _queue_listener
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = _FileQueueHandler(log_queue)
+        queue_handler.setLevel(TRACE_LEVEL)
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        logger.addHandler(queue_handler)
 
         logger.info(f"Logging to file: {log_path}")
 
     return logger
 
 
+atexit.register(_stop_queue_listener)
+
+
+@lru_cache(maxsize=64)
 def get_logger(name: str = "adk_analytics_server") -> logging.Logger:
     """Get a logger instance for the package.
 
@@ -145,7 +311,7 @@ def get_logger(name: str = "adk_analytics_server") -> logging.Logger:
     Returns:
         Logger instance
     """
-    if not name.startswith("adk_analytics_server"):
+    if name != "adk_analytics_server" and not name.startswith("adk_analytics_server."):
         name = f"adk_analytics_server.{name}"
     return logging.getLogger(name)
 
@@ -190,15 +356,13 @@ def log_tool_result(
         extra=extra,
     )
 
-    # Log full structured content at TRACE level (level 5, below DEBUG)
+    # Log full structured content at TRACE level (level 5, below DEBUG).
+    # It is passed only as an extra: the JSON file entry stores it as a field and
+    # ConsoleFormatter serializes it, so nothing is serialized for handlers that
+    # don't show it.
     if structured_content is not None and logger.isEnabledFor(TRACE_LEVEL):
-        import json
         extra["structured_content"] = structured_content
-        logger.log(
-            TRACE_LEVEL,
-            f"Tool structuredContent: {json.dumps(structured_content, default=str)}",
-            extra=extra,
-        )
+        logger.log(TRACE_LEVEL, "Tool structuredContent", extra=extra)
 
 
 def log_data_fetch(
@@ -0,0 +1,58 @@
+"""Convert msgpack log files written with --log-format msgpack back to JSON lines.
+
+Usage:
+  python -m adk_analytics_server.logreader analytics.msgpack
+  python -m adk_analytics_server.logreader analytics.msgpack | jq .
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import orjson
+
+_HEADER = struct.Struct(">I")
+
+
+def read_records(file: BinaryIO) -> Iterator[dict[str, Any]]:
+    """Iterate over the records in a length-prefixed msgpack log file.
+
+    Args:
+        file: Log file opened in binary mode
+
+    Yields:
+        Structured log entries as written by StructuredFormatter
+    """
+    import msgpack
+
+    while True:
+        header = file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return  # End of file (or a record cut off mid-write)
+        (length,) = _HEADER.unpack(header)
+        payload = file.read(length)
+        if len(payload) < length:
+            return
+        yield msgpack.unpackb(payload, timestamp=3)
+
+
+def main() -> None:
+    """Print each record of a msgpack log file as a JSON line."""
+    parser = argparse.ArgumentParser(description="Convert an ADK Analytics msgpack log file to JSON lines")
+    parser.add_argument("log_file", type=Path, help="Log file written with --log-format msgpack")
+    args = parser.parse_args()
+
+    out = sys.stdout.buffer
+    with args.log_file.open("rb") as f:
+        for record in read_records(f):
+            out.write(orjson.dumps(record, default=str, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS))
+            out.write(b"\n")
+
+
+if __name__ == "__main__":
+    main()
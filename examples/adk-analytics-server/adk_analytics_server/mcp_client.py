@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import orjson
 
 from .llm.base import Tool
 
@@ -39,7 +40,16 @@ class MCPClient:
             base_url: Base URL of the MCP server
         """
         self._base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(timeout=60.0)
+        # One long-lived pool so sequential tool calls reuse the same connections
+        self._client = httpx.AsyncClient(
+            timeout=60.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=300.0),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream",
+            },
+        )
         self._tools: list[Tool] | None = None
         self._request_id = 0
 
@@ -68,53 +78,61 @@ class MCPClient:
         if params:
             request["params"] = params
 
-        logger.debug(f"MCP request: {method} {params}")
+        # Guarded so large params/results aren't formatted when DEBUG is off
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"MCP request: {method} {params}")
 
         try:
-            response = await self._client.post(
+            async with self._client.stream(
+                "POST",
                 f"{self._base_url}/mcp",
-                json=request,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream",
-                },
-            )
-            response.raise_for_status()
+                content=orjson.dumps(request),
+            ) as response:
+                response.raise_for_status()
+                # Parse response - MCP server returns SSE format
+                result = await self._read_response(response)
         except httpx.HTTPError as e:
             raise MCPClientError(f"HTTP error communicating with MCP server: {e}")
 
-        # Parse response - MCP server returns SSE format
-        body = response.text
-        result = self._parse_sse_response(body)
-
         if "error" in result:
             error = result["error"]
             raise MCPClientError(f"MCP error: {error.get('message', str(error))}")
 
-        logger.debug(f"MCP response: {result.get('result', {})}")
+        if debug:
+            logger.debug(f"MCP response: {result.get('result', {})}")
         return result.get("result")
 
-    def _parse_sse_response(self, body: str) -> dict[str, Any]:
-        """Parse SSE response from MCP server.
+    async def _read_response(self, response: httpx.Response) -> dict[str, Any]:
+        """Read a JSON-RPC response from a streamed MCP server response.
 
         The server returns responses in SSE format:
         event: message
         data: {"jsonrpc":"2.0",...}
+
+        Lines are parsed as they arrive rather than buffering and splitting the
+        whole body.
         """
-        # Look for data lines and extract JSON
-        for line in body.split("\n"):
-            line = line.strip()
+        result = None
+        other_lines: list[str] = []
+        async for line in response.aiter_lines():
+            if result is not None:
+                continue  # Drain the rest so the connection can be reused
             if line.startswith("data: "):
-                json_str = line[6:]  # Remove "data: " prefix
                 try:
-                    return json.loads(json_str)
-                except json.JSONDecodeError as e:
+                    result = orjson.loads(line[6:])  # Remove "data: " prefix
+                except orjson.JSONDecodeError as e:
                     raise MCPClientError(f"Invalid JSON in SSE response: {e}")
+            else:
+                other_lines.append(line)
+
+        if result is not None:
+            return result
 
         # If no data line found, try parsing the whole body as JSON
         try:
-            return json.loads(body)
-        except json.JSONDecodeError as e:
+            return orjson.loads("\n".join(other_lines))
+        except orjson.JSONDecodeError as e:
             raise MCPClientError(f"Could not parse MCP response: {e}")
 
     async def list_tools(self) -> list[Tool]:
@@ -149,6 +167,14 @@ class MCPClient:
             return await self.list_tools()
         return self._tools
 
+    def invalidate_tools(self) -> None:
+        """Drop the cached tool list so the next get_tools() refetches it.
+
+        Call this when the server's tool registry may have changed (e.g. after
+        reconnecting to a restarted server).
+        """
+        self._tools = None
+
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> ToolResult:
         """Call a tool on the MCP server.
 
@@ -160,13 +186,28 @@ class MCPClient:
             ToolResult with content and optional structured_content
         """
         logger.info(f"Calling tool: {name}")
-        logger.debug(f"Tool arguments: {arguments}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Tool arguments: {arguments}")
 
         result = await self._send_request(
             "tools/call",
             {"name": name, "arguments": arguments},
         )
+        return self._to_tool_result(result)
+
+    async def call_tools_batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[ToolResult]:
+        """Call several independent tools concurrently.
+
+        Args:
+            calls: (tool name, arguments) pairs
+
+        Returns:
+            ToolResults in the same order as calls
+        """
+        return list(await asyncio.gather(*(self.call_tool(name, arguments) for name, arguments in calls)))
 
+    def _to_tool_result(self, result: dict[str, Any]) -> ToolResult:
+        """Convert a tools/call result to a ToolResult."""
         # Extract content from MCP response
         content_parts = result.get("content", [])
         text_content = ""
@@ -179,9 +220,10 @@ class MCPClient:
         # structuredContent is at the top level of the result
         structured_content = result.get("structuredContent")
 
-        logger.debug(f"Tool result: {text_content[:200]}..." if len(text_content) > 200 else f"Tool result: {text_content}")
-        if structured_content:
-            logger.debug(f"Has structured content with keys: {list(structured_content.keys()) if isinstance(structured_content, dict) else 'non-dict'}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Tool result: {text_content[:200]}..." if len(text_content) > 200 else f"Tool result: {text_content}")
+            if structured_content:
+                logger.debug(f"Has structured content with keys: {list(structured_content.keys()) if isinstance(structured_content, dict) else 'non-dict'}")
 
         return ToolResult(
             content=text_content,
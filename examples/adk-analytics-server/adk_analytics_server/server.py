@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import argparse
-import json
+import gzip
+import hashlib
 import os
 import time
-from datetime import datetime
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
+import orjson
 from mcp import types
 from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
 
-from .data import get_stock_data
-from .indicators import calculate_technical_indicators, generate_ai_insights
+from .data import close_http_client, get_stock_data, get_stock_data_many
 from .logging import get_logger, log_tool_call, log_tool_result, setup_logging
 
 VIEW_URI = "ui://adk-analytics/view.html"
@@ -25,8 +30,24 @@ PORT = int(os.environ.get("PORT", "3003"))
 STATIC_DIR = Path(__file__).parent / "static"
 VIEW_HTML_PATH = STATIC_DIR / "view.html"
 
+# View HTML, read on first request (set ADK_DEV_RELOAD=1 to re-read it every time)
+_view_html: str | None = None
+
+# (html, gzip body, ETag) for serving the view over plain HTTP, rebuilt when the HTML changes
+_view_http: tuple[str, bytes, str] | None = None
+
 mcp = FastMCP("ADK Financial Analytics", stateless_http=True)
 
+# Header of the analyze_portfolio text summary returned to the LLM
+_SUMMARY_HEADER = """Portfolio Analysis Complete
+
+**Stocks Analyzed:** {symbols}
+**Period:** {days} days
+**Average Return:** {avg_change:+.2f}%
+
+**Key Insights:**
+"""
+
 # Module logger (configured in main())
 logger = get_logger("server")
 
@@ -42,7 +63,7 @@ logger = get_logger("server")
         "ui/resourceUri": VIEW_URI,  # legacy support
     }
 )
-def analyze_portfolio(
+async def analyze_portfolio(
     symbols: Annotated[str, "Comma-separated stock symbols (e.g., 'AAPL,GOOGL,MSFT')"] = "AAPL,GOOGL,MSFT",
     days: Annotated[int, "Number of days of historical data (1-90)"] = 60,
 ) -> types.CallToolResult:
@@ -56,6 +77,8 @@ def analyze_portfolio(
 
     The UI displays an interactive dashboard with charts and analysis.
     """
+    from .indicators import calculate_technical_indicators, generate_ai_insights
+
     start_time = time.perf_counter()
     log_tool_call(logger, "analyze_portfolio", {"symbols": symbols, "days": days})
 
@@ -63,7 +86,7 @@ def analyze_portfolio(
 
     portfolio_data = {
         "symbols": symbol_list,
-        "analysisDate": datetime.now().isoformat(),
+        "analysisDate": int(time.time() * 1000),  # Epoch ms, like the OHLCV timestamps
         "period": f"{days} days",
         "stocks": {},
         "summary": {},
@@ -72,8 +95,11 @@ def analyze_portfolio(
     total_change_pct = 0
     all_insights = []
 
+    # Fetch all symbols concurrently (cached symbols skip the network)
+    stock_data_by_symbol = await get_stock_data_many(symbol_list, days)
+
     for symbol in symbol_list:
-        stock_data = get_stock_data(symbol, days)
+        stock_data = stock_data_by_symbol[symbol]
         indicators = calculate_technical_indicators(stock_data)
         insights = generate_ai_insights(symbol, indicators)
 
@@ -96,16 +122,12 @@ def analyze_portfolio(
     }
 
     # Generate text summary for LLM
-    text_summary = f"""Portfolio Analysis Complete
-
-**Stocks Analyzed:** {', '.join(symbol_list)}
-**Period:** {days} days
-**Average Return:** {avg_change:+.2f}%
-
-**Key Insights:**
-"""
-    for insight in all_insights[:5]:
-        text_summary += f"\n- [{insight['indicator']}] {insight['title']}: {insight['description']}"
+    parts = [_SUMMARY_HEADER.format(symbols=", ".join(symbol_list), days=days, avg_change=avg_change)]
+    parts.extend(
+        f"- [{insight['indicator']}] {insight['title']}: {insight['description']}"
+        for insight in all_insights[:5]
+    )
+    text_summary = "\n".join(parts)
 
     duration_ms = (time.perf_counter() - start_time) * 1000
     log_tool_result(
@@ -123,7 +145,7 @@ def analyze_portfolio(
 
 
 @mcp.tool(meta={"ui": {"visibility": ["app"]}})
-def get_market_data(
+async def get_market_data(
     symbol: str = "AAPL",
     days: int = 60,
 ) -> list[types.TextContent]:
@@ -134,16 +156,16 @@ def get_market_data(
     start_time = time.perf_counter()
     log_tool_call(logger, "get_market_data", {"symbol": symbol, "days": days})
 
-    data = get_stock_data(symbol, days)
+    data = await get_stock_data(symbol, days)
 
     duration_ms = (time.perf_counter() - start_time) * 1000
     log_tool_result(logger, "get_market_data", f"{len(data)} data points", duration_ms)
 
-    return [types.TextContent(type="text", text=json.dumps(data))]
+    return [types.TextContent(type="text", text=orjson.dumps(data).decode())]
 
 
 @mcp.tool(meta={"ui": {"visibility": ["app"]}})
-def technical_analysis(
+async def technical_analysis(
     symbol: str = "AAPL",
     days: int = 60,
 ) -> list[types.TextContent]:
@@ -151,10 +173,12 @@ def technical_analysis(
 
     Returns RSI, MACD, Bollinger Bands, and Moving Averages.
     """
+    from .indicators import calculate_technical_indicators
+
     start_time = time.perf_counter()
     log_tool_call(logger, "technical_analysis", {"symbol": symbol, "days": days})
 
-    data = get_stock_data(symbol, days)
+    data = await get_stock_data(symbol, days)
     indicators = calculate_technical_indicators(data)
 
     duration_ms = (time.perf_counter() - start_time) * 1000
@@ -165,7 +189,7 @@ def technical_analysis(
         duration_ms,
     )
 
-    return [types.TextContent(type="text", text=json.dumps(indicators))]
+    return [types.TextContent(type="text", text=orjson.dumps(indicators).decode())]
 
 
 # =============================================================================
@@ -176,11 +200,72 @@ def technical_analysis(
 @mcp.resource(
     VIEW_URI,
     mime_type="text/html;profile=mcp-app",
-    meta={"ui": {"csp": {"resourceDomains": ["https://esm.sh", "https://cdn.jsdelivr.net"]}}},
+    meta={"ui": {"csp": {"resourceDomains": ["https://esm.sh"]}}},
 )
 def view() -> str:
     """View HTML resource with CSP metadata for external dependencies."""
-    return VIEW_HTML_PATH.read_text()
+    global _view_html
+    if _view_html is None or os.environ.get("ADK_DEV_RELOAD"):
+        _view_html = VIEW_HTML_PATH.read_text(encoding="utf-8")
+    return _view_html
+
+
+async def view_http(request: Request) -> Response:
+    """Serve the view HTML over plain HTTP, pre-gzipped and with a strong ETag.
+
+    MCP resource reads can't carry HTTP headers, so browsers loading the
+    dashboard directly (e.g. the agent UI iframe) use this route instead.
+    """
+    global _view_http
+    html = view()
+    if _view_http is None or _view_http[0] is not html:
+        body = html.encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        _view_http = (html, gzip.compress(body, compresslevel=9), etag)
+    _, gzipped, etag = _view_http
+
+    # no-cache: the URL isn't versioned, so browsers revalidate and get a 304
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(gzipped, media_type="text/html", headers={**headers, "Content-Encoding": "gzip"})
+    return Response(html, media_type="text/html", headers=headers)
+
+
+# =============================================================================
+# HTTP App
+# =============================================================================
+
+
+def create_http_app() -> Starlette:
+    """Create the MCP HTTP app, closing the Tiingo client on shutdown.
+
+    Serves streamable HTTP at /mcp plus the SSE transport at /sse (with
+    /messages/ for client posts), which keeps one connection open across many
+    tool calls. The view HTML is also available at /view.
+    """
+    app = mcp.streamable_http_app()
+    app.router.routes.extend(mcp.sse_app().routes)
+    app.router.routes.append(Route("/view", view_http))
+    session_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with session_lifespan(app):
+            yield
+        await close_http_client()
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+async def run_stdio() -> None:
+    """Run the MCP server over STDIO, closing the Tiingo client on exit."""
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await close_http_client()
 
 
 # =============================================================================
@@ -229,6 +314,12 @@ Examples:
         metavar="PATH",
         help="Write structured JSON logs to file",
     )
+    parser.add_argument(
+        "--log-format",
+        choices=["json", "msgpack"],
+        default="json",
+        help="Log file format (default: json; msgpack needs the msgpack extra)",
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -252,8 +343,12 @@ Examples:
 
 def main() -> None:
     """Run the MCP server."""
+    import asyncio
+
     import uvicorn
-    from starlette.middleware.cors import CORSMiddleware
+
+    from .cors import FastCORS
+    from .uvicorn_options import uvicorn_speedups
 
     args = parse_args()
 
@@ -262,6 +357,7 @@ def main() -> None:
         verbosity=args.verbose,
         log_file=args.log_file,
         log_level=args.log_level,
+        log_format=args.log_format,
     )
 
     logger.info("Starting ADK Financial Analytics Server")
@@ -273,18 +369,19 @@ def main() -> None:
     if args.stdio:
         # Claude Desktop mode
         logger.info("Running in STDIO mode")
-        mcp.run(transport="stdio")
+        asyncio.run(run_stdio())
     else:
         # HTTP mode for basic-host
-        app = mcp.streamable_http_app()
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_methods=["*"],
-            allow_headers=["*"],
+        app = FastCORS(create_http_app())
+        logger.info(f"Listening on http://{args.host}:{args.port}/mcp (SSE at /sse)")
+        uvicorn.run(
+            app,
+            host=args.host,
+            port=args.port,
+            log_level="debug" if args.verbose else args.log_level.lower(),
+            timeout_keep_alive=75,  # Keep idle client connections open between tool calls
+            **uvicorn_speedups(),
         )
-        logger.info(f"Listening on http://{args.host}:{args.port}/mcp")
-        uvicorn.run(app, host=args.host, port=args.port)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,15 @@
+"""Uvicorn options shared by the MCP and agent server entry points."""
+
+from __future__ import annotations
+
+import sys
+
+
+def uvicorn_speedups() -> dict[str, str]:
+    """Event loop and HTTP parser options for uvicorn.
+
+    Uses uvloop and httptools from ``uvicorn[standard]``. uvloop is not
+    available on Windows, so fall back to the asyncio loop there.
+    """
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    return {"loop": loop, "http": "httptools"}